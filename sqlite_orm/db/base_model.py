@@ -4,7 +4,8 @@ Returns specific model instances with proper typing and thread safety
 """
 
 import logging
-from typing import Any, Dict, List, Optional, Type, TypeVar
+from itertools import groupby
+from typing import Any, Dict, List, Optional, Type, TypeVar, Union
 from sqlite_orm.db.core import DatabaseConnection
 from sqlite_orm.db.queryset import QuerySet
 from sqlite_orm.fields import Field
@@ -34,6 +35,8 @@ class ModelMeta(type):
                 del attrs[key]
         
         attrs['_fields'] = fields
+        attrs['_pk_field'] = next((key for key, field in fields.items()
+                                   if field.primary_key), None)
         
         return super().__new__(cls, name, bases, attrs)
     
@@ -59,6 +62,7 @@ class BaseModel(metaclass=ModelMeta):
     
     table_name: str = None # type: ignore
     _fields: Dict[str, Field] = {}
+    _pk_field: Optional[str] = None
 
     _db: DatabaseConnection = None # type: ignore
     _table_initialized = False
@@ -106,7 +110,7 @@ class BaseModel(metaclass=ModelMeta):
     def init_db(cls, db_path: str = 'db.sqlite3'):
         """Initialize database connection for this model"""
         if not cls._db:
-            cls._db = DatabaseConnection(db_path)
+            cls._db = DatabaseConnection.for_path(db_path)
 
     @classmethod
     def _check_initialized(cls):
@@ -122,10 +126,6 @@ class BaseModel(metaclass=ModelMeta):
         if cls._table_initialized:
             return
         
-        if cls._db.table_exists(cls.table_name):
-            cls._table_initialized = True
-            return
-        
         column_defs = []
         for field_name, field in cls._fields.items():
             sql_type = field.get_sql_type()
@@ -143,10 +143,8 @@ class BaseModel(metaclass=ModelMeta):
             raise RuntimeError(f"Table creation failed for {cls.table_name}")
 
     @classmethod
-    def create(cls: Type[M], **kwargs) -> Optional[M]:
-        """Create a new record and return model instance"""
-        cls._check_initialized()
-        
+    def _prepare_data(cls, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        """Validate insert values and convert them for the database, skipping unknown keys"""
         data = {}
         for field_name, value in kwargs.items():
             if field_name not in cls._fields:
@@ -155,6 +153,14 @@ class BaseModel(metaclass=ModelMeta):
             if not field.validate(value):
                 raise ValueError(f"Validation failed for field {field_name}")
             data[field_name] = field.to_database(value) if value is not None else None
+        return data
+
+    @classmethod
+    def create(cls: Type[M], **kwargs) -> Optional[M]:
+        """Create a new record and return model instance"""
+        cls._check_initialized()
+        
+        data = cls._prepare_data(kwargs)
         
         columns = ", ".join(data.keys())
         placeholders = ", ".join(["?" for _ in data])
@@ -169,10 +175,7 @@ class BaseModel(metaclass=ModelMeta):
             row_id = cursor.lastrowid
             
             if row_id:
-                # Find primary key field
-                pk_field = next((name for name, field in cls._fields.items() 
-                               if field.primary_key), None)
-                
+                pk_field = cls._pk_field
                 if pk_field:
                     # Fetch the created row using same connection
                     fetch_sql = f"SELECT * FROM {cls.table_name} WHERE {pk_field}=?"
@@ -184,6 +187,41 @@ class BaseModel(metaclass=ModelMeta):
         
         return None
 
+    @classmethod
+    def bulk_create(cls, rows: List[Union[Dict[str, Any], 'BaseModel']]) -> int:
+        """
+        Insert many records in a single transaction and return the inserted count
+        Accepts keyword dicts or unsaved model instances (their ids are not populated)
+        """
+        cls._check_initialized()
+        
+        prepared = []
+        for row in rows:
+            if isinstance(row, cls):
+                kwargs = {key: value for key, value in row._data.items()
+                          if not (key == cls._pk_field and value is None)}
+            elif isinstance(row, BaseModel):
+                raise TypeError(f"{cls.__name__}.bulk_create() got a {row.__class__.__name__} instance")
+            else:
+                kwargs = row
+            
+            data = cls._prepare_data(kwargs)
+            if not data:
+                raise ValueError(f"Row has no {cls.__name__} fields to insert: {kwargs!r}")
+            prepared.append(data)
+        
+        inserted = 0
+        with cls._db._get_connection() as conn:
+            cursor = conn.cursor()
+            # Consecutive rows with the same columns share one executemany() call
+            for columns, group in groupby(prepared, key=lambda data: tuple(data.keys())):
+                placeholders = ", ".join(["?" for _ in columns])
+                sql = f"INSERT INTO {cls.table_name} ({', '.join(columns)}) VALUES ({placeholders})"
+                cursor.executemany(sql, [tuple(data.values()) for data in group])
+                inserted += cursor.rowcount
+        
+        return inserted
+
     @classmethod
     def get(cls: Type[M], **filters) -> Optional[M]:
         """Get a single record as model instance"""
@@ -290,9 +328,7 @@ class BaseModel(metaclass=ModelMeta):
         if not self._modified:
             return True
         
-        # Find primary key
-        pk_field = next((name for name, field in self._fields.items() 
-                        if field.primary_key), None)
+        pk_field = self._pk_field
         pk_value = self._data.get(pk_field) if pk_field else None
         
         if pk_value:  # Update existing record
@@ -338,8 +374,7 @@ class BaseModel(metaclass=ModelMeta):
         """Delete this model instance"""
         self._check_initialized()
         
-        pk_field = next((name for name, field in self._fields.items() 
-                        if field.primary_key), None)
+        pk_field = self._pk_field
         pk_value = self._data.get(pk_field) if pk_field else None
         
         if not pk_value:
@@ -350,14 +385,8 @@ class BaseModel(metaclass=ModelMeta):
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert model instance to dictionary"""
-        result = {}
-        for key, value in self._data.items():
-            if key in self._fields:
-                field = self._fields[key]
-                result[key] = field.to_python(value) if value is not None else None
-            else:
-                result[key] = value
-        return result
+        # _data already holds Python values (converted on init, load and assignment)
+        return dict(self._data)
 
     def __repr__(self) -> str:
         return f"<{self.__class__.__name__}: {self._data}>"
\ No newline at end of file
@@ -3,12 +3,17 @@ Core database connection and SQL operations
 Thread-safe connection handling with proper transaction management
 """
 
-import sqlite3, logging, threading
+import os, sqlite3, logging, threading
 from contextlib import contextmanager
+from functools import lru_cache
 from typing import Any, Dict, List, Optional, Tuple, Union
 
 logger = logging.getLogger(__name__)
 
+# Connections inherited from a parent process; SQLite forbids using or closing
+# them after fork(), so they are kept referenced and never touched again
+_inherited_connections: List[sqlite3.Connection] = []
+
 
 class LookupTypes:
     """Django-style lookup types for field comparisons"""
@@ -33,46 +38,118 @@ class LookupTypes:
 class DatabaseConnection:
     """
     Thread-safe SQLite database connection manager
-    Uses connection pooling and locking for concurrent access
+    Each thread gets its own connection; SQLite's WAL locking handles concurrency
     """
     
+    _instances: Dict[str, 'DatabaseConnection'] = {}
+    _instances_lock = threading.Lock()
+    
+    # Seconds a connection waits for another thread's write lock before failing
+    busy_timeout = 30.0
+    
     def __init__(self, db_path: str = 'db.sqlite3'):
+        self.db_path = self._normalize_path(db_path) # Raises ValueError for empty/non-string paths
+        self._local = threading.local() # One open connection per thread
+        self._initialize_database()
+    
+    @classmethod
+    def for_path(cls, db_path: str = 'db.sqlite3') -> 'DatabaseConnection':
+        """
+        Return the shared connection manager for a database path
+        Models using the same file share per-thread connections and skip repeated initialization
+        """
+        key = cls._normalize_path(db_path)
+        with cls._instances_lock:
+            db = cls._instances.get(key)
+            if db is None:
+                db = cls(key)
+                cls._instances[key] = db
+            return db
+    
+    @staticmethod
+    def _normalize_path(db_path: str) -> str:
+        """
+        Resolve relative paths once so equivalent spellings share a manager and
+        threads keep using the same file after a later os.chdir()
+        """
         if not db_path or not isinstance(db_path, str):
             raise ValueError('Database path must be a non-empty string')
-        
-        self.db_path = db_path
-        self._lock = threading.RLock() # Re-entrant lock for thread safety
-        self._initialize_database()
+        if db_path == ':memory:':
+            return db_path
+        return os.path.abspath(db_path)
     
     def _initialize_database(self):
         """Initialize database with optimal settings"""
         try:
             with self._get_connection() as conn:
-                conn.execute("PRAGMA foreign_keys = ON")
+                # journal_mode is persistent, so it only needs to be set once per file
                 conn.execute("PRAGMA journal_mode = WAL")
         except sqlite3.Error as e:
-            logger.error(f"Database initialization failed: {e}")
+            logger.error("Database initialization failed: %s", e)
             raise
     
+    @staticmethod
+    def _configure_connection(conn: sqlite3.Connection):
+        """Apply per-connection settings (these are not stored in the database file)"""
+        conn.execute("PRAGMA foreign_keys = ON")
+        # WAL stays durable against application crashes with NORMAL and skips an fsync per commit
+        conn.execute("PRAGMA synchronous = NORMAL")
+    
+    def _thread_connection(self) -> sqlite3.Connection:
+        """Return this thread's connection, opening and configuring it on first use"""
+        conn = getattr(self._local, 'conn', None)
+        pid = os.getpid()
+        if conn is not None and self._local.pid != pid:
+            # Opened before fork() in the parent process; leave it alone and open a new one
+            _inherited_connections.append(conn)
+            conn = None
+        if conn is None:
+            # Larger statement cache so repeated queries reuse their prepared plans
+            conn = sqlite3.connect(self.db_path, timeout=self.busy_timeout, cached_statements=256)
+            conn.row_factory = sqlite3.Row
+            try:
+                self._configure_connection(conn)
+            except sqlite3.Error:
+                conn.close()
+                raise
+            self._local.conn = conn
+            self._local.depth = 0
+            self._local.pid = pid
+        return conn
+    
     @contextmanager
     def _get_connection(self):
         """
         Thread-safe context manager for database connections
-        Uses re-entrant lock to allow same thread to re-enter
+        Reuses the calling thread's connection; only the outermost block commits
         """
-        with self._lock:
-            conn = sqlite3.connect(self.db_path)
-            conn.row_factory = sqlite3.Row
-            
-            try:
-                yield conn
+        conn = self._thread_connection()
+        self._local.depth += 1
+        
+        try:
+            yield conn
+            if self._local.depth == 1:
                 conn.commit()
-            except Exception as e:
+        except Exception as e:
+            if self._local.depth == 1:
                 conn.rollback()
-                logger.error(f"Database operation failed: {e}")
-                raise
-            finally:
-                conn.close()
+            logger.error("Database operation failed: %s", e)
+            raise
+        finally:
+            self._local.depth -= 1
+    
+    def close(self):
+        """
+        Close the calling thread's connection, if it has one
+        Per-thread connections otherwise stay open until their thread exits
+        """
+        conn = getattr(self._local, 'conn', None)
+        if conn is None or self._local.pid != os.getpid():
+            return
+        if self._local.depth > 0:
+            raise RuntimeError("Cannot close the connection inside an active database operation")
+        conn.close()
+        self._local.conn = None
     
     @contextmanager
     def _get_cursor(self):
@@ -88,7 +165,7 @@ class DatabaseConnection:
                 cursor.execute(sql, params or ())
             return True
         except sqlite3.Error as e:
-            logger.error(f"Execute failed: {e}")
+            logger.error("Execute failed: %s", e)
             return False
     
     def fetch_one(self, sql: str, params: Union[Tuple, None] = None) -> Optional[sqlite3.Row]:
@@ -98,7 +175,7 @@ class DatabaseConnection:
                 cursor.execute(sql, params or ())
                 return cursor.fetchone()
         except sqlite3.Error as e:
-            logger.error(f"Fetch one failed: {e}")
+            logger.error("Fetch one failed: %s", e)
             return None
     
     def fetch_all(self, sql: str, params: Union[Tuple, None] = None) -> List[sqlite3.Row]:
@@ -108,7 +185,7 @@ class DatabaseConnection:
                 cursor.execute(sql, params or ())
                 return cursor.fetchall()
         except sqlite3.Error as e:
-            logger.error(f"Fetch all failed: {e}")
+            logger.error("Fetch all failed: %s", e)
             return []
     
     def table_exists(self, table: str) -> bool:
@@ -125,13 +202,8 @@ class DatabaseConnection:
     
     def _parse_field_lookup(self, field_name: str) -> Tuple[str, str]:
         """Parse Django-style field lookups"""
-        if '__' in field_name:
-            field_parts = field_name.split('__')
-            if len(field_parts) > 1:
-                lookup_type = field_parts[-1]
-                field_name = '__'.join(field_parts[:-1])
-                return field_name, lookup_type
-        return field_name, LookupTypes.EXACT
+        field, lookup_type, _, _ = _compile_lookup(field_name)
+        return field, lookup_type
     
     def _build_where_clause(self, filters: Dict[str, Any]) -> Tuple[str, tuple]:
         """Build WHERE clause from dictionary filters"""
@@ -142,29 +214,11 @@ class DatabaseConnection:
         values = []
         
         for field_name, value in filters.items():
-            field, lookup_type = self._parse_field_lookup(field_name)
+            field, lookup_type, clause, pattern = _compile_lookup(field_name)
             
-            if lookup_type == LookupTypes.EXACT:
-                clauses.append(f"{field}=?")
-                values.append(value)
-            elif lookup_type == LookupTypes.IEACT:
-                clauses.append(f"{field} LIKE ? COLLATE NOCASE")
-                values.append(value)
-            elif lookup_type == LookupTypes.GT:
-                clauses.append(f"{field}>?")
-                values.append(value)
-            elif lookup_type == LookupTypes.GTE:
-                clauses.append(f"{field}>=?")
-                values.append(value)
-            elif lookup_type == LookupTypes.LT:
-                clauses.append(f"{field}<?")
-                values.append(value)
-            elif lookup_type == LookupTypes.LTE:
-                clauses.append(f"{field}<=?")
-                values.append(value)
-            elif lookup_type == LookupTypes.NE:
-                clauses.append(f"{field}!=?")
-                values.append(value)
+            if clause is not None:
+                clauses.append(clause)
+                values.append(pattern.format(value) if pattern else value)
             elif lookup_type == LookupTypes.IN:
                 if isinstance(value, (list, tuple)):
                     placeholders = ", ".join(["?" for _ in value])
@@ -181,32 +235,51 @@ class DatabaseConnection:
                 else:
                     clauses.append(f"{field}!=?")
                     values.append(value)
-            elif lookup_type == LookupTypes.CONTAINS:
-                clauses.append(f"{field} LIKE ?")
-                values.append(f"%{value}%")
-            elif lookup_type == LookupTypes.ICONTAINS:
-                clauses.append(f"{field} LIKE ? COLLATE NOCASE")
-                values.append(f"%{value}%")
-            elif lookup_type == LookupTypes.STARTSWITH:
-                clauses.append(f"{field} LIKE ?")
-                values.append(f"{value}%")
-            elif lookup_type == LookupTypes.ISTARTSWITH:
-                clauses.append(f"{field} LIKE ? COLLATE NOCASE")
-                values.append(f"{value}%")
-            elif lookup_type == LookupTypes.ENDSWITH:
-                clauses.append(f"{field} LIKE ?")
-                values.append(f"%{value}")
-            elif lookup_type == LookupTypes.IENDSWITH:
-                clauses.append(f"{field} LIKE ? COLLATE NOCASE")
-                values.append(f"%{value}")
             elif lookup_type == LookupTypes.ISNULL:
                 if value:
                     clauses.append(f"{field} IS NULL")
                 else:
                     clauses.append(f"{field} IS NOT NULL")
-            else:
-                clauses.append(f"{field}=?")
-                values.append(value)
         
         where_clause = "WHERE " + " AND ".join(clauses) if clauses else ""
-        return where_clause, tuple(values)
\ No newline at end of file
+        return where_clause, tuple(values)
+
+
+# SQL template and value pattern for lookups that bind exactly one parameter
+_SINGLE_VALUE_LOOKUPS = {
+    LookupTypes.EXACT: ("{field}=?", None),
+    LookupTypes.IEACT: ("{field} LIKE ? COLLATE NOCASE", None),
+    LookupTypes.GT: ("{field}>?", None),
+    LookupTypes.GTE: ("{field}>=?", None),
+    LookupTypes.LT: ("{field}<?", None),
+    LookupTypes.LTE: ("{field}<=?", None),
+    LookupTypes.NE: ("{field}!=?", None),
+    LookupTypes.CONTAINS: ("{field} LIKE ?", "%{}%"),
+    LookupTypes.ICONTAINS: ("{field} LIKE ? COLLATE NOCASE", "%{}%"),
+    LookupTypes.STARTSWITH: ("{field} LIKE ?", "{}%"),
+    LookupTypes.ISTARTSWITH: ("{field} LIKE ? COLLATE NOCASE", "{}%"),
+    LookupTypes.ENDSWITH: ("{field} LIKE ?", "%{}"),
+    LookupTypes.IENDSWITH: ("{field} LIKE ? COLLATE NOCASE", "%{}"),
+}
+
+# Lookups whose SQL depends on the value and is built per call
+_VALUE_DEPENDENT_LOOKUPS = (LookupTypes.IN, LookupTypes.NOT_IN, LookupTypes.ISNULL)
+
+
+@lru_cache(maxsize=1024)
+def _compile_lookup(field_name: str) -> Tuple[str, str, Optional[str], Optional[str]]:
+    """
+    Resolve a filter key into (field, lookup type, SQL clause, value pattern)
+    Cached so repeated filters skip parsing and string building; the clause is
+    None for lookups that need the value to build their SQL
+    """
+    field, sep, lookup_type = field_name.rpartition('__')
+    if not sep:
+        field, lookup_type = field_name, LookupTypes.EXACT
+    
+    if lookup_type in _VALUE_DEPENDENT_LOOKUPS:
+        return field, lookup_type, None, None
+    
+    # Unknown lookups fall back to an exact match
+    template, pattern = _SINGLE_VALUE_LOOKUPS.get(lookup_type, _SINGLE_VALUE_LOOKUPS[LookupTypes.EXACT])
+    return field, lookup_type, template.format(field=field), pattern